@@ -0,0 +1,12 @@
+import pandas as pd
+from tipease_core import DATASETS, feather_path, normalize
+
+# ----------------------------------------------------
+# Optional pre-warm of the Feather copies for the bundled datasets
+# (load_default writes them on first use; run: python convert_data.py)
+# ----------------------------------------------------
+if __name__ == "__main__":
+    for path in filter(None, DATASETS.values()):
+        out = feather_path(path)
+        pd.read_csv(path, engine="pyarrow").pipe(normalize).to_feather(out)
+        print(f"{path} -> {out}")
@@ -0,0 +1,235 @@
+import io
+from pathlib import Path
+import streamlit as st
+import pandas as pd
+import numpy as np
+import plotly.express as px
+
+# ----------------------------------------------------
+# Simulated 30-Day Data
+# ----------------------------------------------------
+@st.cache_data(show_spinner=False)
+def generate_data():
+    rng = np.random.default_rng(42)
+    guests = np.array([f"Guest {i}" for i in range(1, 6)])
+    depts = np.array(["Spa", "Valet", "Housekeeping", "Dining", "Pool"])
+    tod_opts = np.array(["Morning", "Afternoon", "Evening"])
+
+    n = 30 * len(guests)
+    days = np.repeat(np.arange(1, 31), len(guests))
+    guest_idx = np.tile(np.arange(len(guests)), 30)
+    keep = rng.random(n) < 0.85
+    return pd.DataFrame({
+        "day": days[keep].astype(np.int8),
+        "guest": guests[guest_idx[keep]],
+        "tip": np.round(rng.uniform(3, 20, n), 2)[keep].astype(np.float32),
+        "dept": pd.Categorical(rng.choice(depts, n)[keep]),
+        "tod": pd.Categorical(rng.choice(tod_opts, n)[keep]),
+    })
+
+# ----------------------------------------------------
+# CSV Loading (cached on the raw file bytes)
+# ----------------------------------------------------
+col_map = {
+    "Day / Día": "day",
+    "Guest ID / Huésped": "guest",
+    "Tip (USD) / Propina (USD)": "tip",
+    "Department / Departamento": "dept",
+    "Time of Day / Hora del Día": "tod",
+    # Spanish-only resort export (Fecha/Hora/Huésped/Ubicación/Propina)
+    "Huésped": "guest",
+    "Ubicación": "dept",
+    "Propina ($)": "tip",
+}
+# Accept the mojibake forms too (UTF-8 headers read back as Latin-1)
+col_map.update({k.encode("utf-8").decode("latin1"): v for k, v in list(col_map.items())})
+
+# Bump whenever normalize() changes its output; cached Feather copies are
+# versioned with it, so copies written by an older normalize() are ignored
+NORMALIZE_VERSION = 2
+
+def normalize(df: pd.DataFrame) -> pd.DataFrame:
+    df.columns = df.columns.str.strip()
+    df = df.rename(columns=col_map)
+    if "Fecha" in df.columns:
+        # Resort export has real dates/times: keep them for the tip log and
+        # derive day numbers + time-of-day buckets for the charts
+        fecha = pd.to_datetime(df["Fecha"].astype(str), errors="coerce").dt.normalize()
+        hora = pd.to_timedelta(df["Hora"].astype(str), errors="coerce")
+        df["timestamp"] = fecha + hora
+        df["day"] = (fecha - fecha.min()).dt.days + 1
+        hour = hora.dt.total_seconds() // 3600
+        df["tod"] = pd.cut(hour, [-1, 11, 16, 23], labels=["Morning", "Afternoon", "Evening"])
+    df["tip"] = pd.to_numeric(df["tip"], errors="coerce", downcast="float").fillna(np.float32(0.0))
+    df["day"] = pd.to_numeric(pd.to_numeric(df["day"], errors="coerce").fillna(0).astype("int64"),
+                              downcast="integer")
+    df["dept"] = df["dept"].astype("category")
+    df["tod"] = df["tod"].astype("category")
+    return df
+
+@st.cache_data(show_spinner=False)
+def load_df(file_bytes: bytes) -> pd.DataFrame:
+    # pyarrow ships with streamlit, so its multithreaded CSV reader is always available
+    return normalize(pd.read_csv(io.BytesIO(file_bytes), engine="pyarrow"))
+
+def feather_path(path):
+    return Path(path).with_suffix(f".v{NORMALIZE_VERSION}.feather")
+
+def load_default(path):
+    # Keyed on the CSV's mtime so an edited CSV is picked up without a restart
+    return read_default(path, Path(path).stat().st_mtime)
+
+@st.cache_data(show_spinner=False)
+def read_default(path, mtime):
+    # Serve the normalized Feather copy if it matches this normalize() version
+    # and is not older than the CSV; otherwise parse the CSV and (re)write it
+    feather = feather_path(path)
+    if feather.exists() and feather.stat().st_mtime >= mtime:
+        return pd.read_feather(feather)
+    df = load_df(Path(path).read_bytes())
+    try:
+        df.to_feather(feather)
+    except (OSError, ValueError, TypeError):
+        pass  # read-only checkout or unserializable column; CSV still works
+    return df
+
+# Bundled datasets selectable from the sidebar (None = simulated)
+DATASETS = {
+    "30-day simulated": None,
+    "15-day bilingual": "Simulated_15-Day_Guest_Tipping_Data__Bilingual_.csv",
+    "Resort export (Fecha/Propina)": "Simulated_TipEase_Resort_Data__Bilingual_.csv",
+}
+
+# ----------------------------------------------------
+# Heatmap Anchors (mock coordinates per department)
+# ----------------------------------------------------
+coords = {
+    "Spa": (0.3,0.7), "Valet": (0.8,0.5),
+    "Housekeeping": (0.5,0.4), "Dining": (0.2,0.3), "Pool": (0.6,0.2),
+    "Beach": (0.85,0.15), "Bar": (0.15,0.6)
+}
+anchor_df = pd.DataFrame([(k, x, y) for k, (x, y) in coords.items()], columns=["eng", "x", "y"])
+
+# Spanish department names -> English anchor keys
+synonyms = pd.Series({
+    "Restaurante": "Dining", "Piscina": "Pool", "Playa": "Beach",
+    "Limpieza": "Housekeeping", "Aparcacoches": "Valet",
+})
+
+# Above this many points, the daily line chart renders through WebGL
+SCATTERGL_MIN_ROWS = 1000
+
+# ----------------------------------------------------
+# Timestamps (only needed for the Recent Tip Log)
+# ----------------------------------------------------
+tod_labels = np.array(["Morning", "Afternoon", "Evening", "Mañana", "Tarde", "Noche"])
+tod_hours = np.array([10, 14, 19, 10, 14, 19], dtype=np.int8)
+
+@st.cache_data(show_spinner=False)
+def add_timestamp(df, base):
+    if "timestamp" in df.columns:
+        # Real timestamps from the source data (resort export)
+        return df
+    idx = pd.Categorical(df["tod"], categories=tod_labels).codes
+    hours = np.where(idx >= 0, tod_hours[idx.clip(0)], 12).astype(np.int8)
+    days = df["day"].fillna(0).astype("int64").to_numpy()
+    return df.assign(timestamp=(base
+                                + pd.to_timedelta(days, unit="D")
+                                + pd.to_timedelta(hours, unit="h")))
+
+# ----------------------------------------------------
+# Cached Aggregations
+# ----------------------------------------------------
+@st.cache_data(show_spinner=False)
+def dept_totals(df):
+    return df.groupby("dept", observed=True, sort=False)["tip"].sum().sort_values(ascending=False).reset_index()
+
+@st.cache_data(show_spinner=False)
+def daily_totals(df):
+    return df.groupby("day", observed=True, sort=False)["tip"].sum().sort_index().reset_index()
+
+@st.cache_data(show_spinner=False)
+def guest_totals(df):
+    return df.groupby("guest", observed=True, sort=False)["tip"].sum().sort_values(ascending=False).reset_index()
+
+@st.cache_data(show_spinner=False)
+def kpi_totals(df):
+    kpis = df.agg({"tip": "sum", "guest": "nunique", "dept": "nunique"})
+    return {"tip": float(kpis["tip"]), "guest": int(kpis["guest"]), "dept": int(kpis["dept"])}
+
+@st.cache_data(show_spinner=False)
+def insights_numbers(df):
+    daily = daily_totals(df)
+    return {
+        "max_day": int(daily.loc[daily["tip"].idxmax(), "day"]),
+        "avg_tip": float(df["tip"].mean()),
+        "top_dept": str(dept_totals(df)["dept"].iloc[0]),
+    }
+
+# ----------------------------------------------------
+# Cached Figures (keyed on the data and the axis labels)
+# ----------------------------------------------------
+@st.cache_resource(show_spinner=False, max_entries=16)
+def build_dept_fig(dep, dept_label, tip_label):
+    fig = px.bar(dep, x="dept", y="tip",
+                 color="dept",
+                 color_discrete_sequence=["#2A9D8F","#E76F51","#264653","#F4A261","#8AB17D"],
+                 labels={"dept":dept_label,"tip":tip_label})
+    fig.update_layout(template="plotly_white", font=dict(size=14))
+    return fig
+
+@st.cache_resource(show_spinner=False, max_entries=16)
+def build_daily_fig(daily, day_label, tip_label):
+    fig = px.line(daily, x="day", y="tip", markers=True,
+                  color_discrete_sequence=["#2A9D8F"],
+                  render_mode="webgl" if len(daily) > SCATTERGL_MIN_ROWS else "svg",
+                  labels={"day":day_label,"tip":tip_label})
+    fig.update_layout(template="plotly_white", font=dict(size=14))
+    return fig
+
+@st.cache_resource(show_spinner=False, max_entries=16)
+def build_heatmap_fig(dep):
+    dept = dep["dept"].astype(str)
+    hdata = (dep.assign(dept=dept, eng=dept.map(synonyms).fillna(dept))
+                .merge(anchor_df, on="eng", how="inner"))
+    fig = px.scatter(
+        hdata, x="x", y="y", size="tip", color="dept",
+        size_max=80, template="plotly_white",
+        labels={"x":"", "y":""}
+    )
+    fig.update_xaxes(showgrid=False, visible=False)
+    fig.update_yaxes(showgrid=False, visible=False)
+    return fig
+
+# ----------------------------------------------------
+# Page Sections (T is the caller's translator)
+# ----------------------------------------------------
+def render_kpis(df, T):
+    k1,k2,k3 = st.columns(3)
+    kpis = kpi_totals(df)
+    k1.metric(T("Total Tips","Propinas Totales"), f"${kpis['tip']:,.2f}")
+    k2.metric(T("Unique Guests","Huéspedes Únicos"), kpis["guest"])
+    k3.metric(T("Departments","Departamentos"), kpis["dept"])
+
+def render_heatmap(df, T):
+    st.title(T("Resort Heatmap","Mapa de Calor del Resort"))
+    st.caption(T("Upload a resort map PNG/JPG to overlay tip intensity.",
+                 "Sube un mapa PNG/JPG para ver la intensidad de propinas."))
+    map_file = st.file_uploader(T("Upload resort map","Subir mapa del resort"), type=["png","jpg","jpeg"])
+    if map_file:
+        # Raw upload bytes are sent as-is, with no decode/re-encode per rerun
+        st.image(map_file.getvalue(), caption=T("Uploaded Resort Map","Mapa del Resort"), use_column_width=True)
+    # Simple heat bubbles (mock coordinates)
+    fig_h = build_heatmap_fig(dept_totals(df))
+    st.plotly_chart(fig_h, use_container_width=True)
+
+def render_insights(df, T):
+    st.title(T("Smart Insights","Recomendaciones"))
+    ins = insights_numbers(df)
+    st.markdown(f"- {T('Highest tipping day:',' Día con más propinas:')} {ins['max_day']}")
+    st.markdown(f"- {T('Average tip:',' Propina promedio:')} ${ins['avg_tip']:.2f}")
+    st.markdown(f"- {T(' Strongest area:',' Área más fuerte:')} {ins['top_dept']}")
+    st.markdown(T("-  Tip peaks around weekends — plan staffing accordingly.",
+                  "- Los picos de propinas suelen ser en fines de semana."))
+    st.markdown(T("-  Consider loyalty perks for top tippers.",
+                  "- Considere beneficios de fidelidad para los mejores huéspedes."))